@@ -7,9 +7,13 @@ Everything else (GUI, CSV handling, analytics, etc.) remains unchanged.
 
 import os
 import re
+import csv
+import atexit
 import time
+import queue
 import datetime
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog
 import customtkinter as ctk
@@ -27,28 +31,113 @@ ctk.set_default_color_theme("dark-blue")
 
 DEFAULT_SUBJECTS = ["Math", "Physics", "Chemistry", "English", "Programming", "Other"]
 DEFAULT_CSV_NAME = "study_log.csv"
+CSV_COLUMNS = ["timestamp", "date", "subject", "duration_seconds"]
+CSV_DTYPES = {"subject": "category", "duration_seconds": "int32"}
+RECENT_ROWS = 18
+FLUSH_ROWS = 8        # write buffered sessions once this many are pending...
+FLUSH_SECONDS = 30    # ...or this long after the first unwritten one
 
 # ---------- TTS ----------
-_tts = pyttsx3.init()
-_tts.setProperty("rate", 150)
-def speak(text):
-    try:
-        _tts.say(text)
-        _tts.runAndWait()
-    except Exception:
-        pass
+# Speech engines are created on first use so users who never use voice don't load audio drivers
+_init_lock = threading.Lock()
+_tts = None
+_tts_queue = queue.Queue()
+SPEAK_TIMEOUT = 5  # seconds a blocking speak() waits for the engine
+
+def _get_tts():
+    global _tts
+    with _init_lock:
+        if _tts is None:
+            _tts = pyttsx3.init()
+            _tts.setProperty("rate", 150)
+    return _tts
+
+def _tts_worker():
+    # pyttsx3 engines are not thread-safe, so every utterance runs on this one thread
+    while True:
+        text, done = _tts_queue.get()
+        try:
+            tts = _get_tts()
+            tts.say(text)
+            tts.runAndWait()
+        except Exception:
+            pass
+        finally:
+            if done is not None: done.set()
+
+threading.Thread(target=_tts_worker, daemon=True).start()
+
+def speak(text, wait=False, timeout=SPEAK_TIMEOUT):
+    """Queue text for the TTS thread; with wait=True, block until it has been spoken or timeout expires."""
+    done = threading.Event() if wait else None
+    _tts_queue.put((text, done))
+    if done is not None:
+        done.wait(timeout)  # runAndWait can hang off the main thread on some platforms
 
 # ---------- Voice Recognition ----------
-_recognizer = sr.Recognizer()
-def listen_once(timeout=6, phrase_time_limit=6):
+_recognizer = None
+_microphone = None
+_stt_pool = ThreadPoolExecutor(max_workers=1)
+_mic_lock = threading.Lock()
+_calibrated = False
+CALIBRATE_SECONDS = 1.0
+PARTIAL_STEP_SECONDS = 1.0
+MAX_PARTIAL_REQUESTS = 2  # recognize_google uses a rate-limited key; partials are only for quick pause/stop
+
+def _get_recognizer():
+    global _recognizer
+    with _init_lock:
+        if _recognizer is None:
+            _recognizer = sr.Recognizer()
+    return _recognizer
+
+def _get_microphone():
+    # Reused across commands; the audio stream itself is still only open inside `with`
+    global _microphone
+    with _init_lock:
+        if _microphone is None:
+            _microphone = sr.Microphone()
+    return _microphone
+
+def _recognize(audio):
     try:
-        with sr.Microphone() as source:
-            _recognizer.adjust_for_ambient_noise(source, duration=0.6)
-            audio = _recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
-        try:
-            return _recognizer.recognize_google(audio)
-        except (sr.UnknownValueError, sr.RequestError):
-            return None
+        return _get_recognizer().recognize_google(audio)
+    except (sr.UnknownValueError, sr.RequestError):
+        return None
+
+def listen_once(timeout=6, phrase_time_limit=6, early_match=None):
+    """Record one phrase, recognizing partial audio while capture is still running.
+
+    If early_match(text) is true for a partial transcript, return it without
+    waiting for the phrase to end. Partial requests stop as soon as one yields
+    speech that doesn't match, since the command can no longer be pause/stop.
+    Ambient noise is measured on the first call only and the threshold reused.
+    """
+    global _calibrated
+    try:
+        with _mic_lock, _get_microphone() as source:
+            if not _calibrated:
+                _get_recognizer().adjust_for_ambient_noise(source, duration=CALIBRATE_SECONDS)
+                _calibrated = True
+            rate, width = source.SAMPLE_RATE, source.SAMPLE_WIDTH
+            step = int(rate * width * PARTIAL_STEP_SECONDS)
+            frames, size, partial = [], 0, None
+            partials_left = MAX_PARTIAL_REQUESTS if early_match else 0
+            for chunk in _get_recognizer().listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit, stream=True):
+                frames.append(chunk.frame_data)
+                size += len(chunk.frame_data)
+                if partial is not None and partial.done():
+                    text = partial.result()
+                    if text:
+                        if early_match(text.lower()):
+                            return text
+                        partials_left = 0  # heard something else: wait for the full phrase
+                    partial = None
+                if partial is None and partials_left and size >= step:
+                    partials_left -= 1
+                    partial = _stt_pool.submit(_recognize, sr.AudioData(b"".join(frames), rate, width))
+                    step = size + int(rate * width * PARTIAL_STEP_SECONDS)
+        return _recognize(sr.AudioData(b"".join(frames), rate, width))
     except Exception as e:
         print("Microphone error:", e)
         return None
@@ -56,33 +145,68 @@ def listen_once(timeout=6, phrase_time_limit=6):
 # ---------- Utilities ----------
 def ensure_csv_exists(path):
     if not os.path.exists(path):
-        df = pd.DataFrame(columns=["timestamp","date","subject","duration_seconds"])
         os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-        df.to_csv(path, index=False)
+        with open(path, 'w', newline='') as f:
+            csv.writer(f).writerow(CSV_COLUMNS)
 
-def append_session_csv(path, subject, duration_seconds):
-    ensure_csv_exists(path)
+def new_session_row(subject, duration_seconds):
     ts = datetime.datetime.now().isoformat()
     date_str = datetime.date.today().isoformat()
-    row = {"timestamp": ts, "date": date_str, "subject": subject, "duration_seconds": int(duration_seconds)}
-    pd.DataFrame([row]).to_csv(path, mode='a', header=False, index=False)
+    return {"timestamp": ts, "date": date_str, "subject": subject, "duration_seconds": int(duration_seconds)}
+
+def tail_rows(path, n=RECENT_ROWS, block=8192):
+    """Return the last n data rows of the CSV (oldest first) without reading the whole file."""
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        size = f.tell()
+        f.seek(max(0, size - block))
+        lines = f.read().decode('utf-8', 'ignore').splitlines()
+    if size > block:
+        lines = lines[1:]  # first line is probably cut in half
+    rows = [r for r in csv.reader(lines) if r and r[0] != "timestamp"]
+    return rows[-n:]
+
+_MM = [f"{i:02d}" for i in range(100)]
 
 def seconds_to_mmss(sec):
-    sec = int(sec)
-    return f"{sec//60:02d}:{sec%60:02d}"
+    m, s = divmod(int(sec), 60)
+    if m >= 100:
+        return f"{m}:{_MM[s]}"
+    return _MM[m] + ":" + _MM[s]
 
 # ---------- Voice Parsing ----------
-def parse_voice_start(text):
+_RE_FOR = re.compile(r"for\s+([a-zA-Z ]+?)(?:\s|$)")
+_RE_MINUTES = re.compile(r"(\d{1,3})\s*(?:minutes|minute|mins|min|m)?")
+_RE_DIGITS = re.compile(r"\d+")
+_RE_STOP = re.compile(r"\b(pause|stop|end)\b")
+_RE_VOICE = re.compile(r"for\s+([a-zA-Z ]+?)\s+(\d{1,3})\s*(?:minutes?|mins?|m)?\b")
+_FILLER_WORDS = {"for", "a", "an", "the", "of", "about", "study", "studying", "session", "sessions"}
+
+def _voice_subject(words, known):
+    # Drop trailing filler ("math for 45", "math session 30"); reuse an existing subject only on a full match
+    words = words.split()
+    while words and words[-1] in _FILLER_WORDS:
+        words.pop()
+    phrase = " ".join(words)
+    return known.get(phrase) or phrase.title() or None
+
+def parse_voice_start(text, known=None):
+    """Return (subject, minutes) from a start command; known maps lowercase names to existing subjects."""
     if not text:
         return None, None
+    known = known or {}
     txt = text.lower()
+    m = _RE_VOICE.search(txt)
+    subj = _voice_subject(m.group(1), known) if m else None
+    if subj:
+        return subj, int(m.group(2))
     subj = None
     minutes = None
-    m = re.search(r"for\s+([a-zA-Z ]+?)(?:\s|$)", txt)
+    m = _RE_FOR.search(txt)
     if m:
         subj = m.group(1).strip().title()
-        subj = re.sub(r"\d+", "", subj).strip()
-    m2 = re.search(r"(\d{1,3})\s*(minutes|minute|mins|min|m)?", txt)
+        subj = _RE_DIGITS.sub("", subj).strip()
+    m2 = _RE_MINUTES.search(txt)
     if m2:
         try:
             minutes = int(m2.group(1))
@@ -99,17 +223,46 @@ class StudyTimerTargetApp(ctk.CTk):
         self.resizable(False, False)
 
         self.subjects = DEFAULT_SUBJECTS.copy()
+        self._subjects_lower = {s.lower(): s for s in self.subjects}
         self.current_subject = tk.StringVar(value=self.subjects[0])
         self.csv_path = os.path.join(os.getcwd(), DEFAULT_CSV_NAME)
         self.daily_target_minutes = tk.IntVar(value=60)
         self.today_minutes = 0
+        self.week_minutes = 0
+        self._target_notified_date = None
         self.timer_running = False
         self.start_time = None
         self.accumulated_seconds = 0
         self._timer_job = None
+        self._last_shown = None
         self.voice_listening = False
+        self._daily_subj = None  # seconds per day (rows) and subject (columns); the only in-memory copy of the log
+        self._csv_mtime = None
+        self._csv_fh = None
+        self._csv_writer = None
+        self._pending_rows = []
+        self._flush_job = None
+        self._closing = False
+        # Blitting state: cached axes background, animated artists and the layout they were drawn for
+        self._bg_subj = None
+        self._subj_bars = []
+        self._subj_key = None
+        self._bg_daily = None
+        self._daily_line = None
+        self._daily_key = None
+        self._charts_dirty = {'subj': True, 'daily': True}
+        self._today_seconds = 0
+        self._today_date = None
+        # CSV reads, appends and aggregation run on this single worker, results are applied via after()
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._agg = None
+        self._refresh_pending = False
+        self._refresh_recent = False
 
         ensure_csv_exists(self.csv_path)
+        self._open_csv()
+        atexit.register(self._shutdown_csv)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._build_ui()
         self._refresh_all_charts()
 
@@ -153,7 +306,7 @@ class StudyTimerTargetApp(ctk.CTk):
 
         # --- EXPANDED Recent Sessions ---
         ctk.CTkLabel(left, text="Recent Sessions", font=ctk.CTkFont(size=14)).pack(pady=(6,4))
-        self.recent_list = tk.Listbox(left, height=18, width=38, bg="#1f2937", fg="white", relief="flat", font=("Consolas", 10))
+        self.recent_list = tk.Text(left, height=RECENT_ROWS, width=38, bg="#1f2937", fg="white", relief="flat", font=("Consolas", 10), state="disabled")
         self.recent_list.pack(pady=(2,8), padx=8, fill="both", expand=True)
 
         # CENTER PANEL
@@ -168,7 +321,8 @@ class StudyTimerTargetApp(ctk.CTk):
         # RIGHT PANEL - Charts
         right = ctk.CTkFrame(main, width=380)
         right.pack(side="right", fill="both", padx=(12,0))
-        tabs = ctk.CTkTabview(right, width=360)
+        tabs = ctk.CTkTabview(right, width=360, command=self._on_tab_change)
+        self.tabs = tabs
         tabs.pack(fill="both", expand=True, pady=(12,12))
         tabs.add("Overview"); tabs.add("Per Subject"); tabs.add("Daily")
         self.ov_label = ctk.CTkLabel(tabs.tab("Overview"), text="No data yet", font=ctk.CTkFont(size=14))
@@ -178,42 +332,76 @@ class StudyTimerTargetApp(ctk.CTk):
         self.ax_subj = self.fig_subj.add_subplot(111)
         self.canvas_subj = FigureCanvasTkAgg(self.fig_subj, master=tabs.tab("Per Subject"))
         self.canvas_subj.get_tk_widget().pack(fill="both", expand=True, padx=4, pady=4)
+        self.canvas_subj.mpl_connect("draw_event", self._on_draw_subj)
 
         self.fig_daily = Figure(figsize=(4.2,3), dpi=100)
         self.ax_daily = self.fig_daily.add_subplot(111)
         self.canvas_daily = FigureCanvasTkAgg(self.fig_daily, master=tabs.tab("Daily"))
         self.canvas_daily.get_tk_widget().pack(fill="both", expand=True, padx=4, pady=4)
+        self.canvas_daily.mpl_connect("draw_event", self._on_draw_daily)
 
     # CSV Path
     def _choose_csv_path(self):
         file = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV","*.csv")], initialfile=DEFAULT_CSV_NAME)
-        if file:
-            os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
-            self.csv_path = file
-            ensure_csv_exists(self.csv_path)
-            speak("CSV path set.")
-            messagebox.showinfo("CSV Path", f"CSV path set to:\n{self.csv_path}")
+        if file and not self._closing:
+            self._pool.submit(self._set_csv_path, file).add_done_callback(self._on_csv_path_set)
+
+    # Runs on the worker; nothing is switched over unless the new file can be opened
+    def _set_csv_path(self, file):
+        os.makedirs(os.path.dirname(file) or ".", exist_ok=True)
+        ensure_csv_exists(file)
+        self._flush_pending()
+        fh = open(file, 'a', newline='', buffering=1)
+        self._close_csv()
+        self.csv_path = file
+        self._csv_fh, self._csv_writer = fh, csv.writer(fh)
+        self._daily_subj = None
+        return file
+
+    def _on_csv_path_set(self, fut):
+        if self._closing: return
+        try:
+            file = fut.result()
+        except Exception as e:
+            self.after(0, messagebox.showerror, "CSV Path", f"Could not use that file:\n{e}")
+            return
+        self.after(0, self._csv_path_applied, file)
+
+    def _csv_path_applied(self, file):
+        self._refresh_all_charts()
+        speak("CSV path set.")
+        messagebox.showinfo("CSV Path", f"CSV path set to:\n{file}")
 
     def _add_subject(self):
         ans = simpledialog.askstring("Add Subject", "Enter subject name:", parent=self)
         if ans:
             s = ans.strip().title()
-            if s not in self.subjects:
-                self.subjects.append(s)
-                self.subject_menu.configure(values=self.subjects)
-                self.current_subject.set(s)
+            if s.lower() not in self._subjects_lower:
+                self.current_subject.set(self._register_subject(s))
+
+    def _register_subject(self, s):
+        """Add s to the subject menu unless a case-insensitive match exists; return the stored name."""
+        key = s.lower()
+        if key not in self._subjects_lower:
+            self._subjects_lower[key] = s
+            self.subjects.append(s)
+            self.subject_menu.configure(values=self.subjects)
+        return self._subjects_lower[key]
 
     # Timer functions
     def _start_timer(self):
         if self.timer_running: return
         self.timer_running = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self._tick()
 
+    def _snapshot_elapsed(self):
+        # Monotonic clock: wall-clock adjustments can't stretch or shrink a session
+        return self.accumulated_seconds + (time.monotonic() - self.start_time if self.timer_running else 0)
+
     def _pause_timer(self):
         if not self.timer_running: return
-        elapsed = time.time() - self.start_time
-        self.accumulated_seconds += elapsed
+        self.accumulated_seconds = self._snapshot_elapsed()
         self.timer_running = False
         if self._timer_job: self.after_cancel(self._timer_job)
         self._refresh_timer_display()
@@ -224,95 +412,348 @@ class StudyTimerTargetApp(ctk.CTk):
         self.accumulated_seconds = 0
         self._refresh_timer_display()
 
+    # Persistent append handle for the session log
+    def _open_csv(self):
+        self._close_csv()
+        self._csv_fh = open(self.csv_path, 'a', newline='', buffering=1)
+        self._csv_writer = csv.writer(self._csv_fh)
+
+    def _close_csv(self):
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = self._csv_writer = None
+
+    def _csv_handle_current(self):
+        # Editors often save by replacing the file; our handle would then append to the old inode
+        try:
+            return os.fstat(self._csv_fh.fileno()).st_ino == os.stat(self.csv_path).st_ino
+        except OSError:
+            return False
+
+    # Saved sessions are buffered and written in batches; the in-memory tables stay authoritative
+    def _flush_pending(self):
+        if not self._pending_rows: return
+        if not self._csv_handle_current():
+            ensure_csv_exists(self.csv_path)
+            self._open_csv()
+        # Rows leave the buffer only once written, so a failed write (disk full, file locked) is retried
+        while self._pending_rows:
+            self._csv_writer.writerow(self._pending_rows[0])
+            del self._pending_rows[0]
+        self._csv_fh.flush()
+        self._csv_mtime = os.path.getmtime(self.csv_path)
+
+    def _schedule_flush(self):
+        if self._flush_job is None:
+            self._flush_job = self.after(FLUSH_SECONDS * 1000, self._request_flush)
+
+    def _request_flush(self):
+        self._flush_job = None
+        if self._closing: return
+        self._pool.submit(self._flush_pending).add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, fut):
+        e = fut.exception()
+        if e is None or self._closing: return
+        self.after(0, self._flush_failed, e)
+
+    def _flush_failed(self, e):
+        self._schedule_flush()
+        messagebox.showerror("Save Error", f"Saved sessions could not be written to the log and will be retried:\n{e}")
+
+    def _shutdown_csv(self):
+        self._flush_pending()
+        self._close_csv()
+
+    def _on_close(self):
+        # Never block the Tk thread on the worker: its callbacks may be waiting on after()
+        if self._closing: return
+        self._closing = True
+        if self._flush_job: self.after_cancel(self._flush_job)
+        final = self._pool.submit(self._shutdown_csv)
+        self._pool.shutdown(wait=False)
+        self._destroy_when_done(final)
+
+    def _destroy_when_done(self, fut):
+        if fut.done():
+            if fut.exception() is not None:
+                messagebox.showerror("Save Error", f"Unsaved sessions could not be written to the log:\n{fut.exception()}")
+            self.destroy()
+        else:
+            self.after(50, self._destroy_when_done, fut)
+
+    # Cached session log (reloaded only when the CSV changes on disk)
+    def _load_df(self):
+        try:
+            mtime = os.path.getmtime(self.csv_path)
+        except OSError:
+            # Log was removed behind our back: recreate it with a header
+            ensure_csv_exists(self.csv_path)
+            mtime = os.path.getmtime(self.csv_path)
+        if self._daily_subj is None or mtime != self._csv_mtime:
+            self._open_csv()  # the file may have been replaced, not just appended to
+            self._flush_pending()  # don't lose buffered rows when re-reading an edited file
+            df = pd.read_csv(self.csv_path, usecols=["date", "subject", "duration_seconds"], parse_dates=['date'], dtype=CSV_DTYPES)
+            self._daily_subj = (df.groupby([pd.DatetimeIndex(df['date']).normalize(), 'subject'], observed=True)
+                                ['duration_seconds'].sum().astype('int64').unstack(fill_value=0))
+            self._csv_mtime = os.path.getmtime(self.csv_path)
+            self._today_date = None
+        return self._daily_subj
+
+    def _append_session(self, subject, duration_seconds):
+        # The row is queued before the log is touched, so a line that doesn't parse can't cost a session
+        row = new_session_row(subject, duration_seconds)
+        self._pending_rows.append([row["timestamp"], row["date"], subject, row["duration_seconds"]])
+        cached = self._daily_subj
+        try:
+            table = self._load_df()
+        except ValueError as e:
+            print("Log parse error:", e)  # charts catch up once the file reads cleanly again
+            table = None
+        if table is not None and table is cached:  # a reload has already read the flushed row
+            self._count_session(table, row)
+        if len(self._pending_rows) >= FLUSH_ROWS:
+            self._flush_pending()
+        return row
+
+    def _count_session(self, table, row):
+        # Only one table cell changes
+        day, subject, seconds = pd.Timestamp(row["date"]), row["subject"], row["duration_seconds"]
+        if subject not in table.columns:
+            table[subject] = 0
+        if day not in table.index:
+            table.loc[day] = 0
+            if not table.index.is_monotonic_increasing:
+                table = self._daily_subj = table.sort_index()
+        table.loc[day, subject] += seconds
+        if self._today_date == datetime.date.today():
+            self._today_seconds += seconds
+
+    # Running total for today; full scan only on cold start, reload or date change
+    def _recompute_today(self):
+        self._load_df()
+        today = datetime.date.today()
+        day = pd.Timestamp(today)
+        self._today_seconds = int(self._daily_subj.loc[day].sum()) if day in self._daily_subj.index else 0
+        self._today_date = today
+
     def _stop_and_save(self):
-        elapsed = 0
-        if self.timer_running: elapsed = time.time() - self.start_time
-        total_seconds = self.accumulated_seconds + elapsed
+        if self._closing: return
+        total_seconds = self._snapshot_elapsed()
         if total_seconds <= 0:
             messagebox.showinfo("No Study Time", "No study time recorded.")
             return
         subj = self.current_subject.get()
-        append_session_csv(self.csv_path, subj, int(total_seconds))
+        self._pool.submit(self._append_session, subj, int(total_seconds)).add_done_callback(self._on_session_saved)
+        self._schedule_flush()
         self.timer_running = False
         self.accumulated_seconds = 0
         self._refresh_timer_display()
-        messagebox.showinfo("Saved", f"{subj} — {int(total_seconds//60)} min saved.")
-        self._refresh_all_charts()
+        self._refresh_all_charts(recent=False)
 
-    def _tick(self):
-        if not self.timer_running: return
-        self._refresh_timer_display()
-        self._timer_job = self.after(1000, self._tick)
+    def _on_session_saved(self, fut):
+        if self._closing: return
+        try:
+            row = fut.result()
+        except Exception as e:
+            self.after(0, messagebox.showerror, "Save Error", f"The session is kept in memory but could not be written to the log:\n{e}")
+            return
+        self.after(0, self._session_saved, row)
 
-    def _refresh_timer_display(self):
-        current = self.accumulated_seconds
-        if self.timer_running: current += time.time() - self.start_time
-        self.time_label.configure(text=seconds_to_mmss(current))
+    def _session_saved(self, row):
+        self._append_recent_row(row["timestamp"], row["subject"], row["duration_seconds"])
+        messagebox.showinfo("Saved", f"{row['subject']} — {row['duration_seconds']//60} min saved.")
 
-    # Refresh charts & logs
-    def _refresh_all_charts(self):
-        self._refresh_recent_sessions()
-        self._refresh_overview()
-        self._draw_subject_chart()
-        self._draw_daily_chart()
+    def _tick(self):
+        if not self.timer_running: return
+        current = self._snapshot_elapsed()
+        if self.state() != 'withdrawn' and self.winfo_viewable():
+            self._refresh_timer_display(current)
+        # Wake up right after the next whole elapsed second instead of drifting by 1000ms steps
+        elapsed_ms = current * 1000
+        self._timer_job = self.after(int(max(10, 1000 - elapsed_ms % 1000)), self._tick)
+
+    def _refresh_timer_display(self, current=None):
+        if current is None: current = self._snapshot_elapsed()
+        txt = seconds_to_mmss(current)
+        if txt != self._last_shown:  # Tk configure is the expensive part of a tick
+            self.time_label.configure(text=txt)
+            self._last_shown = txt
+
+    # Refresh charts & logs (hidden chart tabs are only marked dirty and drawn when selected)
+    def _refresh_all_charts(self, recent=True):
+        # Collapse bursts of refresh requests into one pass once Tk is idle
+        self._refresh_recent = self._refresh_recent or recent
+        if self._refresh_pending: return
+        self._refresh_pending = True
+        self.after_idle(self._submit_refresh)
+
+    def _submit_refresh(self):
+        if self._closing: return
+        recent, self._refresh_recent, self._refresh_pending = self._refresh_recent, False, False
+        self._pool.submit(self._compute_all_aggregates, recent).add_done_callback(self._on_aggregates_done)
+
+    def _on_aggregates_done(self, fut):
+        try:
+            agg = fut.result()
+        except Exception as e:
+            print("Analytics refresh error:", e)
+            return
+        if self._closing: return
+        self.after(0, self._apply_aggregates, agg)
+
+    # Runs on the worker thread: everything derived from the log, no Tk calls
+    def _compute_all_aggregates(self, recent=True):
+        table = self._load_df()
+        if self._today_date != datetime.date.today():
+            self._recompute_today()
+        if recent:
+            self._flush_pending()  # the recent list is read back from the file
+        agg = {'empty': table.empty, 'recent': tail_rows(self.csv_path, RECENT_ROWS) if recent else None,
+               'today_minutes': self._today_seconds // 60, 'week_minutes': 0,
+               'subject': ((), []), 'daily': ((), [])}
+        if table.empty:
+            return agg
+        # Windows are slices of the small day x subject table, not scans of the whole log
+        today = pd.Timestamp.today().normalize()
+        by_subject = table.loc[today - pd.Timedelta(days=6):].sum().sort_index()
+        by_subject = by_subject[by_subject > 0]
+        agg['week_minutes'] = int(by_subject.sum()) // 60
+        agg['subject'] = (tuple(by_subject.index), by_subject.values / 60)
+        rng = pd.date_range(end=today, periods=14, freq='D')
+        by_date = table.loc[rng[0]:].sum(axis=1)
+        agg['daily'] = (tuple(rng.strftime("%b %d")), by_date.reindex(rng, fill_value=0).values / 60.0)
+        return agg
+
+    def _apply_aggregates(self, agg):
+        first = self._agg is None
+        self._agg = agg
+        self.today_minutes, self.week_minutes = agg['today_minutes'], agg['week_minutes']
+        if first and self.today_minutes >= self._daily_target():
+            self._target_notified_date = datetime.date.today()  # only celebrate crossing the target live
+        if agg['recent'] is not None:
+            self._refresh_recent_sessions()
+        self._check_daily_target_and_notify()
+        self._charts_dirty['subj'] = self._charts_dirty['daily'] = True
+        self._on_tab_change()
+
+    def _on_tab_change(self):
+        tab = self.tabs.get()
+        if tab == "Per Subject" and self._charts_dirty['subj']:
+            self._draw_subject_chart()
+        elif tab == "Daily" and self._charts_dirty['daily']:
+            self._draw_daily_chart()
 
     def _refresh_recent_sessions(self):
-        ensure_csv_exists(self.csv_path)
+        # Read-only Text widget: the whole panel is replaced with one insert
         try:
-            df = pd.read_csv(self.csv_path)
-            last = df.tail(18).iloc[::-1] if not df.empty else pd.DataFrame()
-            self.recent_list.delete(0, tk.END)
-            for _, r in last.iterrows():
-                t = r.get("timestamp", "")
-                subj = r.get("subject", "")
-                dur = int(r.get("duration_seconds", 0))
-                ts = str(t)[:16]
-                self.recent_list.insert(tk.END, f"{ts} | {subj} | {dur//60}m")
+            rows = "\n".join(f"{r[0][:16]} | {r[2]} | {int(r[3])//60}m" for r in reversed(self._agg['recent']))
+            self.recent_list.configure(state="normal")
+            self.recent_list.delete("1.0", "end")
+            self.recent_list.insert("1.0", rows)
+            self.recent_list.configure(state="disabled")
         except Exception as e:
             print("Recent refresh error:", e)
 
+    def _append_recent_row(self, ts, subj, dur):
+        row = f"{ts[:16]} | {subj} | {dur//60}m"
+        self.recent_list.configure(state="normal")
+        empty = self.recent_list.compare("end-1c", "==", "1.0")
+        self.recent_list.insert("1.0", row if empty else row + "\n")
+        self.recent_list.delete(f"{RECENT_ROWS}.end", "end-1c")
+        self.recent_list.configure(state="disabled")
+
+    # Blitting: static axes are rendered once into a background, only bars/line are repainted
+    def _on_draw_subj(self, event):
+        self._bg_subj = self.canvas_subj.copy_from_bbox(self.ax_subj.bbox)
+        for bar in self._subj_bars:
+            self.ax_subj.draw_artist(bar)
+
+    def _on_draw_daily(self, event):
+        self._bg_daily = self.canvas_daily.copy_from_bbox(self.ax_daily.bbox)
+        if self._daily_line is not None:
+            self.ax_daily.draw_artist(self._daily_line)
+
+    def _blit(self, canvas, ax, bg, artists):
+        canvas.restore_region(bg)
+        for a in artists:
+            ax.draw_artist(a)
+        canvas.blit(ax.bbox)
+
     def _draw_subject_chart(self):
-        ensure_csv_exists(self.csv_path)
-        df = pd.read_csv(self.csv_path)
+        if self._agg is None: return
+        self._charts_dirty['subj'] = False
+        labels, vals = self._agg['subject']
+        if (labels and labels == self._subj_key and self._bg_subj is not None
+                and vals.max() <= self.ax_subj.get_ylim()[1]):
+            for bar, v in zip(self._subj_bars, vals):
+                bar.set_height(v)
+            self._blit(self.canvas_subj, self.ax_subj, self._bg_subj, self._subj_bars)
+            return
         self.ax_subj.clear()
-        if df.empty:
+        self._subj_bars = []
+        self._subj_key = labels or None
+        if self._agg['empty']:
             self.ax_subj.text(0.5, 0.5, "No data", ha='center', va='center')
-        else:
-            df['date'] = pd.to_datetime(df['date'])
-            cutoff = pd.Timestamp.today() - pd.Timedelta(days=7)
-            grouped = df[df['date'] >= cutoff].groupby('subject')['duration_seconds'].sum()
-            if not grouped.empty:
-                self.ax_subj.bar(grouped.index, grouped.values/60)
-                self.ax_subj.set_ylabel("Minutes (7 days)")
-                self.ax_subj.set_title("Study Time per Subject")
-        self.canvas_subj.draw()
+        elif labels:
+            self._subj_bars = list(self.ax_subj.bar(range(len(labels)), vals, animated=True))
+            self.ax_subj.set_xticks(range(len(labels)))
+            self.ax_subj.set_xticklabels(labels, rotation=30, ha='right')
+            self.ax_subj.set_ylim(0, vals.max() * 1.25 or 1)
+            self.ax_subj.set_ylabel("Minutes (7 days)")
+            self.ax_subj.set_title("Study Time per Subject")
+            self.fig_subj.tight_layout()
+        self._bg_subj = None  # recaptured by _on_draw_subj once the idle draw runs
+        self.canvas_subj.draw_idle()
 
     def _draw_daily_chart(self):
-        ensure_csv_exists(self.csv_path)
-        df = pd.read_csv(self.csv_path)
+        if self._agg is None: return
+        self._charts_dirty['daily'] = False
+        dates, vals = self._agg['daily']
+        if (dates and dates == self._daily_key and self._bg_daily is not None
+                and vals.max() <= self.ax_daily.get_ylim()[1]):
+            self._daily_line.set_ydata(vals)
+            self._blit(self.canvas_daily, self.ax_daily, self._bg_daily, [self._daily_line])
+            return
         self.ax_daily.clear()
-        if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
-            grouped = df.groupby('date')['duration_seconds'].sum()
-            dates = grouped.index.strftime("%b %d")
-            vals = grouped.values / 60
-            self.ax_daily.plot(dates, vals, marker='o')
+        self._daily_line = None
+        self._daily_key = dates or None
+        if dates:
+            self._daily_line, = self.ax_daily.plot(range(len(dates)), vals, marker='o', animated=True)
+            ticks = list(range(len(dates) - 1, -1, -2))[::-1]  # every other day, always including today
+            self.ax_daily.set_xticks(ticks)
+            self.ax_daily.set_xticklabels([dates[i] for i in ticks], rotation=30, ha='right')
+            self.ax_daily.set_ylim(0, vals.max() * 1.25 or 1)
             self.ax_daily.set_ylabel("Minutes")
             self.ax_daily.set_title("Daily Study (last 14 days)")
+            self.fig_daily.tight_layout()
         else:
             self.ax_daily.text(0.5,0.5,"No data",ha='center',va='center')
-        self.canvas_daily.draw()
+        self._bg_daily = None  # recaptured by _on_draw_daily once the idle draw runs
+        self.canvas_daily.draw_idle()
 
     def _refresh_overview(self):
-        ensure_csv_exists(self.csv_path)
-        df = pd.read_csv(self.csv_path)
-        if df.empty:
+        if self._agg['empty']:
             self.ov_label.configure(text="No logged sessions.")
             return
-        df['date'] = pd.to_datetime(df['date'])
-        today = pd.Timestamp.today().date()
-        total_today = df[df['date'].dt.date==today]['duration_seconds'].sum()//60
-        self.ov_label.configure(text=f"Today's total: {int(total_today)} min")
+        self.ov_label.configure(text=f"Today's total: {self.today_minutes} min\nLast 7 days: {self.week_minutes} min")
+
+    def _daily_target(self):
+        try:
+            return max(1, int(self.daily_target_minutes.get()))
+        except (tk.TclError, ValueError):
+            return 60
+
+    def _check_daily_target_and_notify(self):
+        self._refresh_overview()
+        target = self._daily_target()
+        self.progress_label.configure(text=f"Today's progress: {self.today_minutes} / {target} min")
+        self.progress.set(min(1.0, self.today_minutes / target))
+        today = datetime.date.today()
+        if self.today_minutes >= target and self._target_notified_date != today:
+            self._target_notified_date = today
+            speak("Daily target reached. Great work!")
+            messagebox.showinfo("Daily Target", f"You reached your daily target of {target} minutes!")
 
     def _toggle_voice(self):
         if self.voice_listening:
@@ -323,21 +764,25 @@ class StudyTimerTargetApp(ctk.CTk):
             threading.Thread(target=self._voice_worker, daemon=True).start()
 
     def _voice_worker(self):
-        speak("Listening for command.")
-        text = listen_once()
+        speak("Listening for command.", wait=True)  # don't record our own prompt
+        text = listen_once(early_match=_RE_STOP.search)
         self.voice_listening = False
         if not text:
             speak("Try again.")
             return
+        # Tk is not thread-safe: act on the command from the main loop
+        self.after(0, self._handle_voice_text, text)
+
+    def _handle_voice_text(self, text):
         txt = text.lower()
-        if "pause" in txt: self._pause_timer(); return
-        if "stop" in txt: self._stop_and_save(); return
-        subj, _ = parse_voice_start(txt)
+        m = _RE_STOP.search(txt)
+        if m:
+            if m.group(1) == "pause": self._pause_timer()
+            else: self._stop_and_save()
+            return
+        subj, _ = parse_voice_start(txt, self._subjects_lower)
         if subj:
-            if subj not in self.subjects:
-                self.subjects.append(subj)
-                self.subject_menu.configure(values=self.subjects)
-            self.current_subject.set(subj)
+            self.current_subject.set(self._register_subject(subj))
         self._start_timer()
 
 if __name__ == "__main__":